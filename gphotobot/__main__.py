@@ -27,6 +27,11 @@ async def main(args: Namespace):
     logger_conf.configure()
     log = logging.getLogger(__name__)
 
+    # Start tasks eagerly. Most command callbacks and view interactions finish
+    # their first step without awaiting anything, so this lets them skip
+    # being scheduled on the event loop
+    asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
     # Enable gPhoto2 logging
     gp.use_python_logging()
 
@@ -1,6 +1,5 @@
-from datetime import datetime
+from datetime import datetime, timezone
 import logging
-import pytz
 import subprocess
 from typing import Literal
 
@@ -13,6 +12,29 @@ from . import Extensions
 
 _log = logging.getLogger(__name__)
 
+# The error message template and whether to show the traceback for each error
+# that can occur while reloading an extension
+_RELOAD_ERRORS: dict[type[commands.ExtensionError], tuple[str, bool]] = {
+    commands.ExtensionFailed: (
+        "Failed to reload `{}` extension. The `setup()` function encountered "
+        "an error. Bot reverted to original state.",
+        True
+    ),
+    commands.ExtensionNotFound: (
+        "Unexpected error: couldn't find the `{}` extension. Bot reverted to "
+        "original state.",
+        False
+    ),
+    commands.NoEntryPointError: (
+        "Failed to reload `{}` extension: it's missing a `setup()` function.",
+        False
+    ),
+    commands.ExtensionNotLoaded: (
+        "Failed to reload `{}` extension.",
+        False
+    )
+}
+
 
 @app_commands.guilds(settings.DEVELOPMENT_GUILD_ID)
 class Manager(commands.GroupCog,
@@ -41,7 +63,7 @@ class Manager(commands.GroupCog,
             title=f'Management | {name}',
             color=settings.MANAGEMENT_EMBED_COLOR,
             description=description,
-            timestamp=datetime.now(pytz.utc),
+            timestamp=datetime.now(timezone.utc),
             **kwargs
         )
 
@@ -84,7 +106,14 @@ class Manager(commands.GroupCog,
         # Reload the extension
         try:
             await self.bot.reload_extension(extension.value)
-
+        except commands.ExtensionError as e:
+            if type(e) not in _RELOAD_ERRORS:
+                raise
+
+            template, traceback = _RELOAD_ERRORS[type(e)]
+            text = template.format(extension.name)
+            error = getattr(e, 'original', e)
+        else:
             # Return success message
             await interaction.followup.send(embed=self.make_embed(
                 'Reload',
@@ -92,27 +121,6 @@ class Manager(commands.GroupCog,
             ))
             return
 
-        except commands.ExtensionFailed as e:
-            text = (f"Failed to reload `{extension.name}` extension. The "
-                    f"`setup()` function encountered an error. Bot reverted "
-                    f"to original state.")
-            error = e.original
-            traceback = True
-        except commands.ExtensionNotFound as e:
-            text = (f"Unexpected error: couldn't find the `{extension.name}` "
-                    f"extension. Bot reverted to original state.")
-            error = e
-            traceback = False
-        except commands.NoEntryPointError as e:
-            text = (f"Failed to reload `{extension.name}` extension: it's "
-                    f"missing a `setup()` function.")
-            error = e
-            traceback = False
-        except commands.ExtensionNotLoaded as e:
-            text = f"Failed to reload `{extension.name}` extension."
-            error = e
-            traceback = False
-
         # Send an error message
         await utils.handle_err(
             interaction=interaction,
@@ -176,6 +184,17 @@ async def handle_app_command_error(
     command = utils.app_command_name(interaction)
 
     try:
+        # Failed checks (missing permissions, cooldowns, etc.) are the user's
+        # fault, not a bug. Just tell them what went wrong, without the
+        # exception details and traceback
+        if isinstance(error, app_commands.CheckFailure):
+            _log.info(f"Check failed for '{command}': {error}")
+            await utils.update_interaction(
+                interaction,
+                utils.contrived_error_embed(str(error), 'Not Allowed')
+            )
+            return
+
         # Switch to the original error if available
         if isinstance(error, discord.app_commands.CommandInvokeError):
             error = error.original
@@ -24,13 +24,15 @@ class Ping(commands.Cog):
             interaction (discord.Interaction[commands.Bot]): The interaction.
         """
 
-        await interaction.response.send_message(
+        callback = await interaction.response.send_message(
             f'Pong! (response='
             f'{utils.latency(interaction.created_at)})',
             ephemeral=True
         )
 
-        msg = await interaction.original_response()
+        # The callback response includes the sent message, so there's no need
+        # to fetch it with original_response()
+        msg = callback.resource
         latency = utils.latency(interaction.created_at,
                                 msg.created_at)
         await msg.edit(content=f'{msg.content[:-1]}, '
@@ -1,5 +1,6 @@
 import logging
 from collections.abc import Awaitable, Callable
+from typing import Optional
 
 from discord import Interaction, ui
 
@@ -24,7 +25,8 @@ class NewNameModal(ui.Modal, title='Timelapse Name'):
                  on_error: Callable[
                      [Interaction, InvalidTimelapseNameError],
                      Awaitable[None]
-                 ]) -> None:
+                 ],
+                 current_name: Optional[str] = None) -> None:
         """
         Initialize this modal, which prompts the user to enter a new name for
         a timelapse.
@@ -41,7 +43,8 @@ class NewNameModal(ui.Modal, title='Timelapse Name'):
             on_error: The async function to call to handle an invalid name
             error. It passes the interaction that provided the invalid name
             and the error with detailed info about what went wrong.
-
+            current_name: The name the timelapse has now, if any. If the user
+            submits it unchanged, it's not validated again. Defaults to None.
         """
 
         super().__init__()
@@ -50,6 +53,7 @@ class NewNameModal(ui.Modal, title='Timelapse Name'):
             [Interaction, InvalidTimelapseNameError],
             Awaitable[None]
         ] = on_error
+        self.current_name: Optional[str] = current_name
 
         # If the user previously gave an invalid name, add a little reminder
         self.name.placeholder = ('Enter a new, valid name' if previously_invalid
@@ -73,6 +77,10 @@ class NewNameModal(ui.Modal, title='Timelapse Name'):
         # sending a new one
         await interaction.response.defer()
 
+        # If the name didn't change, there's nothing to validate or update
+        if self.name.value == self.current_name:
+            return
+
         # Validate the user's timelapse name
         try:
             validated_name = await validate_name(self.name.value)
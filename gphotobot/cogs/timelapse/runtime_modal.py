@@ -93,10 +93,11 @@ class ChangeRuntimeModal(ui.Modal, title='Timelapse Runtime Config'):
         # Defer a response, as we'll be editing an existing message
         await interaction.response.defer()
 
-        # Parse the start/end times
+        # Parse the start/end times, comparing both to the same current time
+        now = datetime.now()
         try:
-            start = self.parse_time(self.start_time.value, 'Start')
-            end = self.parse_time(self.end_time.value, 'End', start)
+            start = self.parse_time(self.start_time.value, 'Start', now)
+            end = self.parse_time(self.end_time.value, 'End', now, start)
             total_frames = self.parse_total_frames(self.total_frames.value)
         except utils.ValidationError as e:
             # Send the error message
@@ -113,6 +114,7 @@ class ChangeRuntimeModal(ui.Modal, title='Timelapse Runtime Config'):
     def parse_time(self,
                    time: Optional[str],
                    boundary: Literal['Start', 'End'],
+                   now: datetime,
                    start_time: Optional[datetime] = None) -> Optional[datetime]:
         """
         Parse the given time.
@@ -120,6 +122,7 @@ class ChangeRuntimeModal(ui.Modal, title='Timelapse Runtime Config'):
         Args:
             time: The time to parse.
             boundary: Whether this is the start or end time.
+            now: The current time, which the parsed time must come after.
             start_time: If this is the end time, pass the parsed start time to
             confirm that the end time is after it. Defaults to None.
 
@@ -140,7 +143,7 @@ class ChangeRuntimeModal(ui.Modal, title='Timelapse Runtime Config'):
             time = dateutil.parser.parse(time)
         except ValueError:
             clean: str = discord_utils.escape_markdown(time)
-            some_time: str = ((datetime.today() + timedelta(days=1, minutes=85))
+            some_time: str = ((now + timedelta(days=1, minutes=85))
                               .strftime('%Y-%m-%d %I:%M:%S %p'))
             raise utils.ValidationError(
                 attr=boundary + ' Time',
@@ -159,8 +162,8 @@ class ChangeRuntimeModal(ui.Modal, title='Timelapse Runtime Config'):
             )
 
         # Make sure the time is in the future
-        if time <= datetime.now():
-            if time.date() == datetime.now().date():
+        if time <= now:
+            if time.date() == now.date():
                 clean: str = time.strftime('%I:%M:%S %p')
             else:
                 clean: str = time.strftime(self.DATE_TIME_FORMAT)
@@ -174,7 +177,7 @@ class ChangeRuntimeModal(ui.Modal, title='Timelapse Runtime Config'):
 
         # Make sure the end time is after the start time
         if time is not None and start_time is not None and time <= start_time:
-            today: date = date.today()
+            today: date = now.date()
             if time.date() == today and start_time.date() == today:
                 clean: str = time.strftime('%I:%M:%S %p')
                 start: str = start_time.strftime('%I:%M:%S %p')
@@ -17,6 +17,13 @@ class ChangeTracker[T](TracksChanges):
     def __init__(self, value: T) -> None:
         self._current_value = value
 
+        # If the value has a version number that increments when it's modified
+        # (like a Schedule), record the initial version. As long as it's still
+        # the same object with the same version, it doesn't need to be compared
+        # to the original
+        self._versioned_value = value
+        self._original_version = getattr(value, 'version', None)
+
         try:
             self._original_value = copy(value)
         except TypeError:
@@ -74,13 +81,19 @@ class ChangeTracker[T](TracksChanges):
         This also recognizes built-in iterable types, checking whether any
         contained elements implement ChangeTracker and have changed.
 
+        Objects with a `version` attribute skip the comparison to the original
+        value if the version hasn't changed.
+
         Returns:
             True if and only if the value has changed.
         """
 
         current = self._current_value
-        if current != self.original:
-            return True
+        if self._original_version is None or \
+                current is not self._versioned_value or \
+                current.version != self._original_version:
+            if current != self.original:
+                return True
 
         if isinstance(current, TracksChanges):
             return current.has_changed()
@@ -10,6 +10,16 @@ from .days import Days
 
 
 class DaysOfWeek(set[DayEnum], Days):
+    # The descriptive_header() for each number of days, except for the special
+    # cases of weekends and weekdays
+    DESCRIPTIVE_HEADERS: tuple[str, ...] = (
+        'Never',
+        'Once every week',
+        'Twice per week',
+        *(f'{utils.num_to_word(n)} days per week' for n in range(3, 7)),
+        'Every day'
+    )
+
     def __init__(self, days: Iterable[DayEnum] = ()):
         """
         Initialize a DaysOfWeek rule set with zero or more days of the week.
@@ -301,18 +311,12 @@ class DaysOfWeek(set[DayEnum], Days):
         """
 
         n = len(self)
-        if n == 0:
-            return 'Never'
-        elif n == 1:
-            return 'Once every week'
-        elif n == 2:
-            return 'On weekends' if self == utils.WEEKENDS else 'Twice per week'
+        if n == 2 and self == utils.WEEKENDS:
+            return 'On weekends'
         elif n == 5 and self == utils.WEEK_DAYS:
             return 'On weekdays'
-        elif n == 7:
-            return 'Every day'
         else:
-            return f'{utils.num_to_word(n)} days per week'
+            return self.DESCRIPTIVE_HEADERS[n]
 
     def excluded_days(self) -> list[DayEnum]:
         """
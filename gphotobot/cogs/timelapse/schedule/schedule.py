@@ -30,6 +30,10 @@ class Schedule(list[ScheduleEntry], TracksChanges):
         """
 
         super().__init__()
+
+        # Incremented whenever entries are added, removed, or rearranged
+        self.version: int = 0
+
         if entries is not None:
             for entry in entries:
                 self.append(entry)
@@ -134,9 +138,15 @@ class Schedule(list[ScheduleEntry], TracksChanges):
         # ========== Validation passed ==========
 
         super().append(entry)
+        self.version += 1
+
+    def __setitem__(self, index, value):
+        super().__setitem__(index, value)
+        self.version += 1
 
     def __delitem__(self, index):
         super().__delitem__(index)
+        self.version += 1
 
         # Adjust the index of all items after the one that was deleted
         for i in range(index, len(self)):
@@ -144,6 +154,7 @@ class Schedule(list[ScheduleEntry], TracksChanges):
 
     def remove(self, __value):
         super().remove(__value)
+        self.version += 1
 
         # Make sure indices are consecutive
         for i in range(len(self)):
@@ -165,14 +176,16 @@ class Schedule(list[ScheduleEntry], TracksChanges):
             entry up or the last entry down.
         """
 
+        n = len(self)
+
         # Check for an invalid index
-        if index < 0 or index > len(self):
+        if index < 0 or index > n:
+            plural = 'y' if n == 1 else 'ies'
             raise IndexError(f"Attempted to move invalid index {index} "
-                             f"for a schedule with {len(self)} "
-                             f"entr{'y' if len(self) == 1 else 'ies'}")
+                             f"for a schedule with {n} entr{plural}")
         elif index == 0 and move_up:
             raise IndexError("Attempted to move up the entry at index 0")
-        elif index == len(self) - 1 and not move_up:
+        elif index == n - 1 and not move_up:
             raise IndexError("Attempted to move down the last entry at "
                              f"index {index}")
 
@@ -216,7 +229,7 @@ class Schedule(list[ScheduleEntry], TracksChanges):
             if len(text) + len(line) + 2 <= max_len:
                 text += '\n- ' + line
             else:
-                omitted = len(self) - entry.index - 1
+                omitted = n - entry.index - 1
                 footer = f"*(plus {omitted} more)*"
                 while len(text) + len(footer) > max_len:
                     omitted += 1
@@ -11,13 +11,14 @@ from .. import timelapse_utils
 from .change_tracker import ChangeTracker, TracksChanges
 from .schedule import Schedule
 from .schedule_entry import ScheduleEntry
-from .schedule_entry_builder import ScheduleEntryBuilder
-from .schedule_entry_selector import ScheduleEntrySelector
 
 _log = logging.getLogger(__name__)
 
 
 class ScheduleBuilder(utils.BaseView, TracksChanges):
+    # Merge bursts of clicks into a single message edit
+    REFRESH_DELAY: float = 0.05
+
     def __init__(self,
                  parent: Interaction[GphotoBot] | utils.BaseView | Message,
                  start_time: Optional[datetime],
@@ -68,6 +69,10 @@ class ScheduleBuilder(utils.BaseView, TracksChanges):
         self.total_frames: ChangeTracker[Optional[int]] = \
             ChangeTracker(total_frames)
 
+        # Cache the runtime text for the embed along with the runtime values
+        # used to generate it
+        self._cached_runtime_text: Optional[tuple[tuple, str]] = None
+
         # Create the buttons
         self.button_save = self.create_button(
             label='Save',
@@ -155,12 +160,16 @@ class ScheduleBuilder(utils.BaseView, TracksChanges):
             The embed.
         """
 
-        # Get runtime info
-        runtime_text = timelapse_utils.generate_embed_runtime_text(
-            self.start_time.current,
-            self.end_time.current,
-            self.total_frames.current
-        )
+        # Get runtime info, reusing the cached text if nothing changed
+        runtime = (self.start_time.current,
+                   self.end_time.current,
+                   self.total_frames.current)
+        cached = self._cached_runtime_text
+        if cached is not None and cached[0] == runtime:
+            runtime_text = cached[1]
+        else:
+            runtime_text = timelapse_utils.generate_embed_runtime_text(*runtime)
+            self._cached_runtime_text = (runtime, runtime_text)
 
         # Add a message about the schedule below (in the embed fields)
         if len(self.schedule.current) == 0:
@@ -188,6 +197,14 @@ class ScheduleBuilder(utils.BaseView, TracksChanges):
         # Return the fully constructed embed
         return embed
 
+    def render_key(self) -> tuple:
+        return (self.start_time.current,
+                self.end_time.current,
+                self.total_frames.current,
+                tuple((e.index, e.fingerprint())
+                      for e in self.schedule.current),
+                self.component_key())
+
     def has_changed(self) -> bool:
         return self.start_time.has_changed() or \
             self.end_time.has_changed() or \
@@ -244,14 +261,19 @@ class ScheduleBuilder(utils.BaseView, TracksChanges):
         total frames have been set.
         """
 
-        if self.start_time is not None or self.end_time is not None or \
-                self.total_frames is not None:
-            self.button_runtime.label = 'Change Overall Runtime'
-            self.button_runtime.emoji = settings.EMOJI_CHANGE_TIME
-        elif self.start_time is None and self.end_time is None and \
-                self.total_frames is None:
-            self.button_runtime.label = 'Set Overall Runtime'
-            self.button_runtime.emoji = settings.EMOJI_SET_RUNTIME
+        if self.start_time.current is not None or \
+                self.end_time.current is not None or \
+                self.total_frames.current is not None:
+            label = 'Change Overall Runtime'
+            emoji = settings.EMOJI_CHANGE_TIME
+        else:
+            label = 'Set Overall Runtime'
+            emoji = settings.EMOJI_SET_RUNTIME
+
+        # Only modify the button if it's changing
+        if self.button_runtime.label != label:
+            self.button_runtime.label = label
+            self.button_runtime.emoji = emoji
 
     async def select_button_save(self) -> None:
         """
@@ -301,7 +323,9 @@ class ScheduleBuilder(utils.BaseView, TracksChanges):
             self.update_save_cancel_buttons()
             await self.refresh_display()
 
-        # Send a view for making a new entry
+        # Send a view for making a new entry. This is imported here, as it's
+        # only needed once the user starts editing the schedule
+        from .schedule_entry_builder import ScheduleEntryBuilder
         await ScheduleEntryBuilder(
             parent=self,
             callback=callback,
@@ -360,6 +384,7 @@ class ScheduleBuilder(utils.BaseView, TracksChanges):
             await self.refresh_display()
 
         # There are multiple entries. Create and send a selector to pick one
+        from .schedule_entry_selector import ScheduleEntrySelector
         await ScheduleEntrySelector(
             self,
             self.schedule.current,
@@ -385,6 +410,7 @@ class ScheduleBuilder(utils.BaseView, TracksChanges):
                 self.update_save_cancel_buttons()
                 await self.refresh_display()
 
+            from .schedule_entry_builder import ScheduleEntryBuilder
             await ScheduleEntryBuilder(
                 parent=self,
                 callback=callback,
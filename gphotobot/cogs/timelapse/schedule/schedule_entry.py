@@ -67,9 +67,17 @@ class ScheduleEntry(TracksChanges):
             {} if config is None else config
         )
 
+        # Incremented whenever the config dict is modified
+        self._config_version: int = 0
+
         # Optional database record if this was made from an existing db entry
         self._db_record: SQLScheduleEntry | None = db_record
 
+        # The most recent embed field strings, paired with the fingerprint() of
+        # this entry at the time they were built
+        self._cached_field_strings: \
+            Optional[tuple[tuple, tuple[str, str]]] = None
+
     @classmethod
     def from_db(cls, record: SQLScheduleEntry) -> ScheduleEntry:
         """
@@ -161,6 +169,7 @@ class ScheduleEntry(TracksChanges):
         # Make sure the key isn't already paired with this value
         if key not in cfg or cfg[key] != value:
             cfg[key] = value
+            self._config_version += 1
 
             # Update db entry if present
             if self.db_record is not None:
@@ -188,6 +197,7 @@ class ScheduleEntry(TracksChanges):
         # Make sure the key is in there first
         if key in cfg:
             del cfg[key]
+            self._config_version += 1
 
             # Update db entry if present
             if self.db_record is not None:
@@ -234,6 +244,22 @@ class ScheduleEntry(TracksChanges):
 
         return NotImplemented
 
+    def fingerprint(self) -> tuple:
+        """
+        Get a hashable snapshot of everything displayed about this entry: the
+        days rule, start/end times, and configuration. If this entry's
+        fingerprint hasn't changed, neither has its appearance to the user.
+
+        The configuration is represented by a version number that increases
+        with each change, so it doesn't need to be copied or compared.
+
+        Returns:
+            A tuple identifying the current state of this entry.
+        """
+
+        return (self.days.to_db(), self.start_time, self.end_time,
+                self._config_version)
+
     def has_changed(self) -> bool:
         return self._days.has_changed() or \
             self._start_time.has_changed() or \
@@ -299,6 +325,26 @@ class ScheduleEntry(TracksChanges):
         The second parameter, the body text, lists the start/end times and
         configuration.
 
+        These are cached until something about this entry changes.
+
+        Returns:
+            A tuple with the embed header and contents, in that order.
+        """
+
+        fingerprint = self.fingerprint()
+        cached = self._cached_field_strings
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+
+        strings = self._build_embed_field_strings()
+        self._cached_field_strings = (fingerprint, strings)
+        return strings
+
+    def _build_embed_field_strings(self) -> tuple[str, str]:
+        """
+        Build the strings returned by get_embed_field_strings(), bypassing the
+        cache.
+
         Returns:
             A tuple with the embed header and contents, in that order.
         """
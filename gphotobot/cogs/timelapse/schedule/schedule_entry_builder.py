@@ -1,7 +1,7 @@
 from collections.abc import Awaitable, Callable
 from datetime import date, time, timedelta
 import logging
-from typing import Optional, Union
+from typing import cast, Optional, Union
 
 from discord import ButtonStyle, Embed, Interaction, Message, ui
 
@@ -12,12 +12,24 @@ from .dates import Dates
 from .days import Days
 from .days_of_week import DaysOfWeek
 from .schedule_entry import ScheduleEntry
-from .schedule_modals import ScheduleRuntimeModal, SpecificDatesModal
 
 _log = logging.getLogger(__name__)
 
+# Options in the rule selection menu. These must match Days.str_rule()
+_RULE_DAYS_OF_WEEK = 'Days of the week'
+_RULE_SPECIFIC_DATES = 'Specific dates'
+_RULE_EVERY_DAY = 'Every day'
+
+# Labels for each day of the week in the DaysOfWeek selection menu
+_DAY_LABELS: tuple[str, ...] = tuple(d.name.capitalize() for d in DayEnum)
+_DAY_TO_LABEL: dict[DayEnum, str] = dict(zip(DayEnum, _DAY_LABELS))
+_DAY_FROM_LABEL: dict[str, DayEnum] = dict(zip(_DAY_LABELS, DayEnum))
+
 
 class ScheduleEntryBuilder(utils.BaseView):
+    # Merge bursts of clicks into a single message edit
+    REFRESH_DELAY: float = 0.05
+
     def __init__(self,
                  parent: Interaction[GphotoBot] | utils.BaseView | Message,
                  callback: Callable[[Optional[ScheduleEntry]], Awaitable[None]],
@@ -72,15 +84,13 @@ class ScheduleEntryBuilder(utils.BaseView):
         # Note that the option strings must correspond with Days.rule_type_str()
         self.menu_rule: ui.Select = self.create_select_menu(
             placeholder='Pick a scheduling rule',
-            options=['Days of the week', 'Specific dates', 'Every day'],
+            options=[_RULE_DAYS_OF_WEEK, _RULE_SPECIFIC_DATES,
+                     _RULE_EVERY_DAY],
             defaults=[current_rule_str],
             callback=self.select_run_rule,
             row=0
         )
 
-        # If the entry already has information, add associated components
-        self.components: tuple[Union[ui.Button, ui.Select], ...] = ()
-
         # Create/add the set_times button
         self.button_set_times: ui.Button = self.create_button(
             label='Set Start/End Times',
@@ -119,8 +129,9 @@ class ScheduleEntryBuilder(utils.BaseView):
             row=2
         )
 
+        # If the entry already has information, add associated components
         if entry is not None:
-            self.components = self.add_rule_specific_components(entry.days)
+            self.add_rule_specific_components(entry.days)
 
         _log.debug(f'Created schedule entry builder on entry {entry}')
 
@@ -191,28 +202,47 @@ class ScheduleEntryBuilder(utils.BaseView):
         # Return the finished embed
         return embed
 
-    def add_rule_specific_components(
-            self,
-            rule: Days,
-            row: int = 1) -> tuple[Union[ui.Button, ui.Select], ...]:
+    def render_key(self) -> tuple:
+        return (None if self.entry is None else self.entry.fingerprint(),
+                self.component_key())
+
+    @property
+    def components(self) -> tuple[Union[ui.Button, ui.Select], ...]:
+        """
+        Get the components used for editing the current days rule. These are
+        all the children of this view other than the rule selection menu and
+        the buttons that are always present.
+
+        Returns:
+            The rule-specific components in the order they were added, or an
+            empty tuple if there aren't any yet.
+        """
+
+        fixed = (self.menu_rule,
+                 self.button_set_times,
+                 self.button_custom_interval,
+                 self.button_save,
+                 self.button_cancel)
+        return tuple(c for c in self.children if c not in fixed)
+
+    def add_rule_specific_components(self, rule: Days, row: int = 1) -> None:
         """
         Create the components used for editing the particular days rule. The
         components are automatically added to the view in the specified row.
+        Any existing rule-specific components are removed first.
 
         Args:
             rule: The rule to edit with these components.
             row: The row in which to add the components. Defaults to 1.
-
-        Returns:
-            A tuple of added components dedicated to the specified rule. These
-            are given in the order that they should be added to the view.
         """
 
         # If there are no active components, that means this is the first time
         # add them. We need to shift a bunch of buttons down one row to make
-        # space
+        # space. (They're re-added so the view recalculates the row widths)
+        existing = self.components
+        first_time = not existing
         shifted_buttons = None
-        if not self.components:
+        if first_time:
             shifted_buttons = (self.button_set_times,
                                self.button_custom_interval,
                                self.button_save,
@@ -220,26 +250,26 @@ class ScheduleEntryBuilder(utils.BaseView):
             self.remove_items(shifted_buttons)
             for btn in shifted_buttons:
                 btn.row += 1
+        else:
+            self.remove_items(existing)
 
         # Use a selection menu for days of the week
         if isinstance(rule, DaysOfWeek):
-            menu: ui.Select = self.create_select_menu(
+            self.create_select_menu(
                 placeholder='Pick days to run',
-                options=[d.name.capitalize() for d in DayEnum],
-                defaults=[d.name.capitalize() for d in rule],
+                options=list(_DAY_LABELS),
+                defaults=[_DAY_TO_LABEL[d] for d in rule],
                 no_maximum=True,
                 callback=self.select_week_days,
                 row=row
             )
 
-            if not self.components:
+            if first_time:
                 self.add_items(shifted_buttons)
 
-            return (menu,)
-
         # Use a set of buttons for specific dates
         elif isinstance(rule, Dates):
-            add: ui.Button = self.create_button(
+            self.create_button(
                 label='Add',
                 style=ButtonStyle.secondary,
                 emoji=settings.EMOJI_ADD_SCHEDULE,
@@ -248,7 +278,7 @@ class ScheduleEntryBuilder(utils.BaseView):
                 auto_defer=False
             )
 
-            remove: ui.Button = self.create_button(
+            self.create_button(
                 label='Remove',
                 style=ButtonStyle.secondary,
                 emoji=settings.EMOJI_REMOVE_SCHEDULE,
@@ -258,7 +288,7 @@ class ScheduleEntryBuilder(utils.BaseView):
                 auto_defer=False
             )
 
-            clear: ui.Button = self.create_button(
+            self.create_button(
                 label='Clear',
                 style=ButtonStyle.secondary,
                 emoji=settings.EMOJI_DELETE,
@@ -267,13 +297,12 @@ class ScheduleEntryBuilder(utils.BaseView):
                 row=row
             )
 
-            if not self.components:
+            if first_time:
                 self.add_items(shifted_buttons)
 
-            return add, remove, clear
-
-        # Some new unsupported Days type
-        raise ValueError(f"Unexpected days rule type {type(rule)}")
+        else:
+            # Some new unsupported Days type
+            raise ValueError(f"Unexpected days rule type {type(rule)}")
 
     async def select_run_rule(self, _: Interaction) -> None:
         """
@@ -289,7 +318,7 @@ class ScheduleEntryBuilder(utils.BaseView):
         change_components = True
         selection: str = self.menu_rule.values[0]
 
-        if selection == 'Specific dates':
+        if selection == _RULE_SPECIFIC_DATES:
             # Switch to the Dates rule type
             if self.entry is None:
                 self.entry = ScheduleEntry(index=self.index, days=Dates())
@@ -299,7 +328,7 @@ class ScheduleEntryBuilder(utils.BaseView):
                 self.entry.days = Dates()
         else:
             # Switch to the DaysOfWeek rule type
-            every_day = selection == 'Every day'
+            every_day = selection == _RULE_EVERY_DAY
 
             if self.entry is None:
                 self.entry = ScheduleEntry(
@@ -315,11 +344,7 @@ class ScheduleEntryBuilder(utils.BaseView):
                     # It's already using the DaysOfWeek dropdown. The user
                     # switched to 'Every Day', so add all the days of the week
                     self.entry.days.update(utils.EVERY_DAY_OF_WEEK)  # noqa
-                    utils.set_menu_default(
-                        self.components[0],
-                        tuple(d.name.capitalize()
-                              for d in self.entry.days)  # noqa
-                    )
+                    utils.set_menu_default(self.components[0], _DAY_LABELS)
                 else:
                     # The user went from 'Every day' to 'Days of the week'.
                     # No changes are necessary at all
@@ -337,8 +362,7 @@ class ScheduleEntryBuilder(utils.BaseView):
 
         # Replace the rule-specific components if necessary
         if change_components:
-            self.remove_items(self.components)
-            self.components = self.add_rule_specific_components(self.entry.days)
+            self.add_rule_specific_components(self.entry.days)
 
         # Update the display, as something will have changed (otherwise we
         # would have already returned)
@@ -363,7 +387,7 @@ class ScheduleEntryBuilder(utils.BaseView):
                                        start_time=start_time,
                                        end_time=end_time)
             utils.set_menu_default(self.menu_rule, self.entry.days.str_rule())
-            self.components = self.add_rule_specific_components(self.entry.days)
+            self.add_rule_specific_components(self.entry.days)
         elif self.entry.start_time == start_time and \
                 self.entry.end_time == end_time:
             # No change
@@ -397,7 +421,7 @@ class ScheduleEntryBuilder(utils.BaseView):
             # Create a default entry, so we can set its interval
             self.entry = ScheduleEntry(index=self.index)
             utils.set_menu_default(self.menu_rule, self.entry.days.str_rule())
-            self.components = self.add_rule_specific_components(self.entry.days)
+            self.add_rule_specific_components(self.entry.days)
 
         # Set button label based on whether an interval is present
         if interval is None:
@@ -419,7 +443,9 @@ class ScheduleEntryBuilder(utils.BaseView):
             interaction: The interaction that triggered this callback.
         """
 
-        # Create the modal with the current values if there are any
+        # Create the modal with the current values if there are any. The
+        # modals are imported lazily, as they pull in the date parser
+        from .schedule_modals import ScheduleRuntimeModal
         if self.entry is None:
             modal = ScheduleRuntimeModal(self.set_start_end_time)
         else:
@@ -500,27 +526,24 @@ class ScheduleEntryBuilder(utils.BaseView):
             menu: The selection menu with the days of the week.
         """
 
-        days: set[DayEnum] = {DayEnum.from_full_name(n) for n in menu.values}
+        days: set[DayEnum] = {_DAY_FROM_LABEL[n] for n in menu.values}
 
         # Don't do anything unless this changes the selection
-        entry_days = self.entry.days
-        assert isinstance(entry_days, DaysOfWeek)
+        entry_days = cast(DaysOfWeek, self.entry.days)
         if entry_days == days:
             return
 
-        # If all 7 days are currently selected, then this is going to de-select
-        # some of them. In that case, change the rule selector from "Every day"
-        # to "Days of the week"
-        if len(entry_days) == 7:
-            utils.set_menu_default(self.menu_rule, 'Days of the week')
+        # If this selects all 7 days, change the rule selector to "Every day".
+        # If all 7 days were selected before, this is going to de-select some of
+        # them, so change it from "Every day" to "Days of the week"
+        if len(days) == 7:
+            utils.set_menu_default(self.menu_rule, _RULE_EVERY_DAY)
+        elif len(entry_days) == 7:
+            utils.set_menu_default(self.menu_rule, _RULE_DAYS_OF_WEEK)
 
         # Update the entry with new rule
         self.entry.days = DaysOfWeek(days)
 
-        # If all 7 days are selected now, change rule selector to "Every day"
-        if len(days) == 7:
-            utils.set_menu_default(self.menu_rule, 'Every day')
-
         # Make sure the currently selected values stay selected
         utils.set_menu_default(menu, menu.values)
 
@@ -541,26 +564,44 @@ class ScheduleEntryBuilder(utils.BaseView):
             (False).
         """
 
-        # Define the callback function
-        async def update_dates(dates: list[date], _add: bool):
-            # Update the dates
-            days = self.entry.days
-            assert isinstance(days, Dates)
-            days.add(dates) if _add else days.remove(dates)
-
-            # Disable/enable buttons based on how many dates there are
-            n = len(days)
-            self.components[0].disabled = n == Dates.MAX_ALLOWED_DATES
-            self.components[1].disabled = n == 0
-            self.components[2].disabled = n == 0
-
-            await self.refresh_display()
-
         # Create and send the modal for adding dates
+        from .schedule_modals import SpecificDatesModal
         await interaction.response.send_modal(SpecificDatesModal(
-            update_dates, add
+            self.update_dates, add
         ))
 
+    async def update_dates(self, dates: list[date], add: bool) -> None:
+        """
+        This is the callback for the modal that adds or removes specific dates.
+
+        Update the dates in the entry, and refresh the display.
+
+        Args:
+            dates: The dates given by the user.
+            add: Whether to add the dates (True) or remove them (False).
+        """
+
+        # Update the dates
+        days = cast(Dates, self.entry.days)
+        days.add(dates) if add else days.remove(dates)
+
+        # Disable/enable buttons based on how many dates there are
+        self.update_date_buttons(len(days))
+        await self.refresh_display()
+
+    def update_date_buttons(self, n: int) -> None:
+        """
+        Enable or disable the add, remove, and clear buttons for specific dates
+        based on the number of dates currently in the rule.
+
+        Args:
+            n: The number of dates.
+        """
+
+        add, remove, clear = self.components
+        add.disabled = n == Dates.MAX_ALLOWED_DATES
+        remove.disabled = clear.disabled = n == 0
+
     async def click_button_clear_dates(self, interaction: Interaction) -> None:
         """
         This is the callback for the clear button for specific dates.
@@ -571,8 +612,7 @@ class ScheduleEntryBuilder(utils.BaseView):
             interaction: The interaction that triggered this callback.
         """
 
-        days = self.entry.days
-        assert isinstance(days, Dates)
+        days = cast(Dates, self.entry.days)
 
         if len(days) == 0:
             # This should be unreachable
@@ -586,7 +626,5 @@ class ScheduleEntryBuilder(utils.BaseView):
 
         # Clear dates, and update the display
         self.entry.days = Dates()
-        self.components[0].disabled = False
-        self.components[1].disabled = True
-        self.components[2].disabled = True
+        self.update_date_buttons(0)
         await self.refresh_display()
@@ -164,8 +164,9 @@ class ScheduleEntrySelector(utils.BaseView):
 
         # Enable/disable move buttons based on the index
         if self.mode == 'move':
+            last = len(self.schedule) - 1
             self.move_up.disabled = self.index == 0
-            self.move_down.disabled = self.index == len(self.schedule) - 1
+            self.move_down.disabled = self.index == last
 
         # Make sure the selected entry persists when the display is refreshed
         utils.set_menu_default(self.menu, self.menu.values[0])
@@ -205,8 +206,9 @@ class ScheduleEntrySelector(utils.BaseView):
         self.menu.options[self.index].default = True
 
         # Enable/disable the move buttons based on the index
+        last = len(self.schedule) - 1
         self.move_up.disabled = self.index == 0
-        self.move_down.disabled = self.index == len(self.schedule) - 1
+        self.move_down.disabled = self.index == last
 
         # Update this display
         await self.refresh_display()
@@ -1,6 +1,8 @@
 from collections.abc import Awaitable, Callable
 from datetime import date, datetime, time, timedelta
+import functools
 import logging
+import re
 from typing import Literal, Optional
 
 import dateutil.parser
@@ -11,6 +13,9 @@ from .dates import Dates
 
 _log = logging.getLogger(__name__)
 
+# Separators between the dates in the SpecificDatesModal
+_DATE_SEPARATOR_REGEX = re.compile(r'[;,\n]+')
+
 
 class ScheduleRuntimeModal(ui.Modal, title='Schedule Runtime'):
     # This is very similar to runtime_modal.ChangeRuntimeModal, except that it
@@ -218,12 +223,9 @@ class SpecificDatesModal(ui.Modal, title='Add Dates'):
             await self.callback(None, self.adding)
             return
 
-        # Split by commas and semicolons
-        date_strs: list[str] = (
+        # Split by commas, semicolons, and newlines
+        date_strs: list[str] = _DATE_SEPARATOR_REGEX.split(
             self.dates_field.value
-            .replace(';', ',')
-            .replace('\n', ',')
-            .split(',')
         )
 
         # Parse the dates
@@ -339,7 +341,22 @@ class SpecificDatesModal(ui.Modal, title='Add Dates'):
             The examples.
         """
 
-        today: str = datetime.now().strftime('%Y-%m-%d')
-        future: str = ((datetime.now() + timedelta(days=600))
-                       .strftime('%m/%d/%Y'))
-        return f"\"{today}\" or \"{future}\""
+        return _get_examples(date.today())
+
+
+@functools.lru_cache(maxsize=1)
+def _get_examples(today: date) -> str:
+    """
+    Build the example dates for SpecificDatesModal.get_examples(). These only
+    change when the day changes, so the result is cached for the given date.
+
+    Args:
+        today: The current date.
+
+    Returns:
+        The examples.
+    """
+
+    future: date = today + timedelta(days=600)
+    return f"\"{today.strftime('%Y-%m-%d')}\" or " \
+           f"\"{future.strftime('%m/%d/%Y')}\""
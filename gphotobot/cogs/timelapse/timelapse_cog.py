@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import logging
+from typing import Optional
 
-from discord import app_commands, Embed, Interaction, utils as discord_utils
+from discord import (app_commands, Embed, Interaction, User,
+                     utils as discord_utils)
 from discord.ext import commands
 from sqlalchemy import select
 from sqlalchemy.exc import SQLAlchemyError
@@ -26,23 +28,33 @@ class TimelapseCog(commands.GroupCog,
     def __init__(self, bot: GphotoBot):
         self.bot: GphotoBot = bot
 
-    async def get_timelapse_info(self, timelapse: Timelapse) -> str:
+    async def get_timelapse_info(
+            self,
+            timelapse: Timelapse,
+            users: Optional[dict[int, User]] = None) -> str:
         """
         Get a formatted string with information about a timelapse. This is
         designed for Discord.
 
         Args:
             timelapse: The timelapse.
+            users: Users already looked up, by id. The owner is added to this
+            if it's not already there, so that each owner is only fetched once
+            across multiple timelapses. Defaults to None.
 
         Returns:
             str: The info string.
         """
 
-        user = self.bot.get_user(timelapse.user_id)
+        user = None if users is None else users.get(timelapse.user_id)
         if user is None:
-            _log.debug(f'User {timelapse.user_id} not cached: '
-                       f'fetching via API call')
-            user = await self.bot.fetch_user(timelapse.user_id)
+            user = self.bot.get_user(timelapse.user_id)
+            if user is None:
+                _log.debug(f'User {timelapse.user_id} not cached: '
+                           f'fetching via API call')
+                user = await self.bot.fetch_user(timelapse.user_id)
+            if users is not None:
+                users[timelapse.user_id] = user
 
         # List basic known info
         return (f'**Status:** {timelapse.state.name}'
@@ -91,11 +103,21 @@ class TimelapseCog(commands.GroupCog,
         # Defer the interaction
         await interaction.response.defer(thinking=True)
 
-        # Query active timelapses from database
+        # Query active timelapses from database. Only get as many as can fit
+        # in the embed (plus one to tell whether there are more). If there
+        # are more, count them separately
         try:
             async with async_session_maker() as session:  # read-only session
                 active_timelapses: list[Timelapse] = \
-                    await timelapses.get_active_timelapses(session)
+                    await timelapses.get_active_timelapses(
+                        session, limit=const.EMBED_FIELD_MAX_COUNT + 1
+                    )
+
+                n = len(active_timelapses)
+                if n > const.EMBED_FIELD_MAX_COUNT:
+                    n = max(n, await timelapses.count_active_timelapses(
+                        session
+                    ))
         except SQLAlchemyError as error:
             await utils.handle_err(
                 interaction=interaction,
@@ -115,7 +137,6 @@ class TimelapseCog(commands.GroupCog,
             return
 
         # Build an embed with a list of timelapses
-        n = len(active_timelapses)
         embed = utils.default_embed(
             title="Active Timelapses",
             description=f"Found {n} active timelapse{'' if n == 1 else 's'}."
@@ -126,18 +147,20 @@ class TimelapseCog(commands.GroupCog,
             active_timelapses = \
                 active_timelapses[:const.EMBED_FIELD_MAX_COUNT - 1]
 
-        # Add info for each timelapse
+        # Add info for each timelapse. Owners not in the cache are fetched from
+        # the Discord API, but only once per owner
+        users: dict[int, User] = {}
         for timelapse in active_timelapses:
             embed.add_field(
                 name=f'__{discord_utils.escape_markdown(timelapse.name)}__',
-                value=await self.get_timelapse_info(timelapse),
+                value=await self.get_timelapse_info(timelapse, users),
                 inline=False
             )
 
         # Again, if there are too many timelapses to fit, indicate how many
         # were omitted
         if n > const.EMBED_FIELD_MAX_COUNT:
-            omitted = n - const.EMBED_FIELD_MAX_COUNT - 1
+            omitted = n - (const.EMBED_FIELD_MAX_COUNT - 1)
             embed.add_field(
                 name=f"{omitted} more...",
                 value=f"{omitted} more timelapses not shown",
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Awaitable, Callable
 from datetime import datetime, timedelta
 import logging
@@ -28,6 +29,10 @@ _log = logging.getLogger(__name__)
 
 
 class TimelapseCreator(utils.BaseView):
+    # Merge the refreshes from related setters into a single message edit.
+    # (The refresh that first shows this view is never delayed)
+    REFRESH_DELAY: float = 0.05
+
     def __init__(self,
                  parent: Interaction[GphotoBot] | utils.BaseView | Message,
                  name: str,
@@ -194,18 +199,28 @@ class TimelapseCreator(utils.BaseView):
             InvalidTimelapseNameError: If the given name is not valid.
         """
 
-        # Validate the input name if enabled
-        if do_validate:
-            name = await validate_name(name)
+        # Start getting a default camera. It doesn't depend on the name, so
+        # it can run while the name is validated
+        async def get_camera() -> Optional[GCamera]:
+            try:
+                return await gmanager.get_default_camera()
+            except NoCameraFound:
+                return None  # Worry about this later
 
-        # Determine the default directory
-        directory: Optional[Path] = determine_default_directory(name)
+        camera_task = asyncio.create_task(get_camera())
 
-        # Get a default camera
         try:
-            camera = await gmanager.get_default_camera()
-        except NoCameraFound:
-            camera = None  # Worry about this later
+            # Validate the input name if enabled
+            if do_validate:
+                name = await validate_name(name)
+
+            # Determine the default directory
+            directory: Optional[Path] = await determine_default_directory(name)
+        except BaseException:
+            camera_task.cancel()
+            raise
+
+        camera = await camera_task
 
         # Build and send the timelapse creator view
         await cls(parent, name, camera, directory).refresh_display()
@@ -277,13 +292,14 @@ class TimelapseCreator(utils.BaseView):
         if self.name == name:
             return
 
-        _log.debug(f"Changing timelapse name from '{self.name}' to '{name}'")
+        _log.debug("Changing timelapse name from '%s' to '%s'",
+                   self.name, name)
 
         # If the previous directory, is unset or uses the previous name, try to
         # change it based on the new name
         if self.directory is None or \
                 self.name.lower() in self.directory.name.lower():
-            await self.set_directory(determine_default_directory(name),
+            await self.set_directory(await determine_default_directory(name),
                                      refresh=False)
 
         # Change the name
@@ -328,10 +344,10 @@ class TimelapseCreator(utils.BaseView):
         if self.directory is None:
             self.button_directory.label = 'Change Directory'
             self._directory = directory
-            _log.debug(f"Updated directory from None to '{directory}'")
+            _log.debug("Updated directory from None to '%s'", directory)
         elif self.directory != directory:
-            _log.debug(f"Updated directory from '{self.directory}' "
-                       f"to '{directory}'")
+            _log.debug("Updated directory from '%s' to '%s'",
+                       self.directory, directory)
             self._directory = directory
             if refresh:
                 await self.refresh_display()
@@ -354,8 +370,7 @@ class TimelapseCreator(utils.BaseView):
         assert interval is not None  # Just making sure
 
         if self.interval is None:
-            utils.get_button(self, 'Set Interval').label = \
-                'Change Interval'
+            self.button_interval.label = 'Change Interval'
         elif self.interval == interval:
             return
 
@@ -389,12 +404,34 @@ class TimelapseCreator(utils.BaseView):
         effect of possibly changing the label and emoji on the associated
         button.
 
+        If anything changed, this also refreshes the display.
+
         Args:
             start_time: The new start time.
             end_time: The new end time.
             total_frames:  The new total frame count.
         """
 
+        if self._apply_runtime(start_time, end_time, total_frames):
+            await self.refresh_display()
+
+    def _apply_runtime(self,
+                       start_time: datetime | None,
+                       end_time: datetime | None,
+                       total_frames: int | None) -> bool:
+        """
+        Update the runtime values and the runtime button without refreshing
+        the display.
+
+        Args:
+            start_time: The new start time.
+            end_time: The new end time.
+            total_frames:  The new total frame count.
+
+        Returns:
+            True if and only if any of the values changed.
+        """
+
         # Change the button label, if applicable
         if start_time is not None or end_time is not None or \
                 total_frames is not None:
@@ -408,7 +445,7 @@ class TimelapseCreator(utils.BaseView):
         if total_frames == self.total_frames and \
                 start_time == self.start_time and \
                 end_time == self.end_time:
-            return
+            return False
 
         # Update the values
         self._start_time = start_time
@@ -421,8 +458,7 @@ class TimelapseCreator(utils.BaseView):
             self._timelapse.end_time = end_time
             self._timelapse.total_frames = total_frames
 
-        # Refresh the display
-        await self.refresh_display()
+        return True
 
     @property
     def camera(self) -> Optional[GCamera]:
@@ -483,7 +519,7 @@ class TimelapseCreator(utils.BaseView):
         Note that it is possible for the schedule to be None, meaning that it's
         either removed or the other parameters have been changed instead.
 
-        After updating the schedule, this refreshes the display.
+        After updating the schedule, this refreshes the display once.
 
         Args:
             start_time: The (possibly new) runtime start.
@@ -492,7 +528,7 @@ class TimelapseCreator(utils.BaseView):
             new_schedule: The (possibly new) timelapse schedule.
         """
 
-        await self.set_runtime(start_time, end_time, total_frames)
+        self._apply_runtime(start_time, end_time, total_frames)
         self._schedule = new_schedule
 
         # Change in the timelapse record too, if there is one
@@ -513,6 +549,19 @@ class TimelapseCreator(utils.BaseView):
         # Update the display
         await self.refresh_display()
 
+    def render_key(self) -> tuple:
+        return (self._timelapse is None,  # Determines the title
+                self.name,
+                None if self.camera is None else self.camera.name,
+                self.directory,
+                self.interval,
+                self.start_time,
+                self.end_time,
+                self.total_frames,
+                None if self.schedule is None
+                else tuple(e.fingerprint() for e in self.schedule),
+                self.component_key())
+
     async def build_embed(self, *args, **kwargs) -> Embed:
         """
         Construct an embed with the info about this timelapse. This embed is
@@ -595,8 +644,9 @@ class TimelapseCreator(utils.BaseView):
             return
 
         # If there's a timelapse record, we're in edit mode. Send that to the
-        # callback function
+        # callback function, which takes over the message
         if self._timelapse is not None:
+            await self._cancel_pending_refresh()
             await self.callback(self._timelapse)
             _log.debug(f"Saved changes to timelapse: '{self.name}'")
             return
@@ -711,6 +761,9 @@ class TimelapseCreator(utils.BaseView):
             _: The interaction that triggered this UI event.
         """
 
+        # Don't let a pending refresh overwrite whatever replaces this view
+        await self._cancel_pending_refresh()
+
         if self.callback_cancel is not None:
             # If there's a cancel callback, run that.
             await self.callback_cancel()
@@ -747,7 +800,8 @@ class TimelapseCreator(utils.BaseView):
         await interaction.response.send_modal(NewNameModal(
             self.set_name,
             False,
-            on_error
+            on_error,
+            current_name=self.name
         ))
 
     async def select_button_directory(self, interaction: Interaction) -> None:
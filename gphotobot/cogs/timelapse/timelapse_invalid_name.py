@@ -75,10 +75,10 @@ class TimelapseInvalidNameView(utils.BaseView):
                     value='Timelapse creation automatically cancelled.',
                     inline=False
                 )
-                # Disable all buttons
-                for child in self.children:
-                    if hasattr(child, 'disabled'):
-                        child.disabled = True
+                # Disable both buttons. (discord.py replaces the decorated
+                # methods with their buttons on the instance)
+                self.input_new_name.disabled = True  # noqa
+                self.cancel.disabled = True  # noqa
 
                 # Show embed is disabled
                 embed.color = settings.DISABLED_ERROR_EMBED_COLOR  # noqa
@@ -1,7 +1,10 @@
+import asyncio
 import logging
 import os
 from pathlib import Path
 import re
+import stat
+import time
 from typing import Literal, Optional
 
 from discord import Embed
@@ -14,6 +17,18 @@ from gphotobot.sql.models.timelapses import (Timelapse, NAME_MAX_LENGTH,
 
 _log = logging.getLogger(__name__)
 
+# Regexes used when validating timelapse names
+_CONSECUTIVE_SEPARATOR_REGEX = re.compile(r'([_-])[-_]+')
+_WHITESPACE_REGEX = re.compile(r'\s')
+
+# Names recently found to be taken. This maps the lowercase name to the name
+# used in the database and the time.monotonic() at which the entry expires. It
+# absorbs repeated attempts with the same name. Only taken names are cached,
+# as a free name could be claimed at any moment
+_TAKEN_NAMES: dict[str, tuple[str, float]] = {}
+_TAKEN_NAMES_TTL: float = 5
+_TAKEN_NAMES_MAX_SIZE: int = 256
+
 
 class InvalidTimelapseNameError(Exception):
     def __init__(self,
@@ -48,17 +63,18 @@ class InvalidTimelapseNameError(Exception):
         self.problem = problem
         self.is_shortened = is_shortened
 
-    def build_embed(self) -> Embed:
+        # The user-friendly message, which is built the first time it's needed
+        self._message: Optional[str] = None
+
+    def build_message(self) -> str:
         """
-        Build an embed that explains in user-friendly terms what's wrong with
-        the name they tried to use.
+        Build a user-friendly message explaining what's wrong with the name the
+        user tried to use.
 
         Returns:
-            A new embed.
+            The message.
         """
 
-        # Build a user-friendly message explaining what they did wrong
-
         if self.problem == 'taken' or self.problem == 'taken_case':
             msg = (f"Sorry, there is already a timelapse called "
                    f"**\"{self.name}\"** in the database. You must "
@@ -66,36 +82,53 @@ class InvalidTimelapseNameError(Exception):
             if self.problem == 'taken_case':
                 msg += ("\n\nDifferent capitalization doesn't count: \"name\" "
                         "and \"NaMe\" are not sufficiently unique.")
-        elif self.problem == 'too_long':
+        elif self.problem == 'length':
             name_trunc = utils.trunc(self.name, NAME_MAX_LENGTH,
                                      escape_markdown=True)
             msg = (f"Sorry, your timelapse name **\"{name_trunc}**\" is too "
                    f"long. Timelapse names can't be longer than "
                    f"{NAME_MAX_LENGTH} characters.")
         elif self.problem == 'char':
-            # Explain which characters are allowed. Include the lines about
-            # starting with a letter and not having spaces only if the user
-            # violated those parts
+            # Explain which characters are allowed. (The name must start with
+            # a letter, or it'd be a 'start_char' problem). Include the line
+            # about not having spaces only if the user violated that part
 
             name_esc = utils.trunc(self.name, NAME_MAX_LENGTH,
                                    escape_markdown=True)
             msg = (f"Sorry, your timelapse name **\"{name_esc}\"** isn't "
                    "valid. Names can only use letters, numbers, hyphens, and "
                    "underscores.")
-            if not self.name[0].isalpha():
-                msg = msg[:-1] + ', and they must start with a letter.'
-            if re.search(r'\s', self.name):
+            if _WHITESPACE_REGEX.search(self.name):
                 msg += ' Spaces are not allowed.'
         elif self.problem == 'start_char':
-            msg = (f"Sorry, your timelapse name **\"{self.name}\"** "
+            name_esc = utils.trunc(self.name, NAME_MAX_LENGTH,
+                                   escape_markdown=True)
+            msg = (f"Sorry, your timelapse name **\"{name_esc}\"** "
                    "isn't valid. Names must __start with a letter__ and use "
                    "only letters, numbers, hyphens, and underscores.")
+            if _WHITESPACE_REGEX.search(self.name):
+                msg += ' Spaces are not allowed.'
         else:
             raise ValueError(f"Unreachable: problem='{self.problem}'")
 
+        return msg
+
+    def build_embed(self) -> Embed:
+        """
+        Build an embed that explains in user-friendly terms what's wrong with
+        the name they tried to use. The message is only built once per error,
+        as the same error is shown again each time the user retries that name.
+
+        Returns:
+            A new embed.
+        """
+
+        if self._message is None:
+            self._message = self.build_message()
+
         # Put the error message in an embed
         embed = utils.contrived_error_embed(
-            text=msg,
+            text=self._message,
             title='Error: Invalid Name'
         )
 
@@ -126,31 +159,87 @@ async def validate_name(name: str) -> str:
     """
 
     # Consolidate consecutive hyphens/underscores
-    n = re.sub(r'([_-])[-_]+', r'\1', name)
+    n = _CONSECUTIVE_SEPARATOR_REGEX.sub(r'\1', name)
     is_shortened = name != n
 
     if len(n) > NAME_MAX_LENGTH or len(n) < 1:
         raise InvalidTimelapseNameError(n, 'length', is_shortened)
 
-    if re.search(r'[^\w-]', n):
-        raise InvalidTimelapseNameError(name, 'char', is_shortened)
-
+    # Check the first character before scanning the whole name
     if not n[0].isalpha():
         raise InvalidTimelapseNameError(name, 'start_char', is_shortened)
 
-    # Check database for duplicate name
-    async with async_session_maker() as session:  # read-only session
-        stmt = (select(Timelapse)
-                .where(func.lower(Timelapse.name) == n.lower()))
-        result: Timelapse = (await session.scalars(stmt)).first()
-        if result is not None:
-            raise InvalidTimelapseNameError(
-                n, 'taken' if result.name == n else 'taken_case', is_shortened
-            )
+    # Only allow letters, numbers, hyphens, and underscores. This matches the
+    # regex [\w-]+ (\w is anything str.isalnum() allows plus underscores),
+    # but it's faster than running a regex on every name
+    if not n.replace('-', '').replace('_', '').isalnum():
+        raise InvalidTimelapseNameError(name, 'char', is_shortened)
+
+    # Check database for duplicate name, unless it was recently found to be
+    # taken. Only the name is needed, so don't load the whole timelapse
+    key = n.lower()
+    taken: Optional[str] = _get_taken_name(key)
+    if taken is None:
+        async with async_session_maker() as session:  # read-only session
+            stmt = (select(Timelapse.name)
+                    .where(func.lower(Timelapse.name) == key)
+                    .limit(1))
+            taken = await session.scalar(stmt)
+
+        if taken is not None:
+            _cache_taken_name(key, taken)
+
+    if taken is not None:
+        raise InvalidTimelapseNameError(
+            n, 'taken' if taken == n else 'taken_case', is_shortened
+        )
 
     return n
 
 
+def _get_taken_name(key: str) -> Optional[str]:
+    """
+    Get the database name of a timelapse from the recently taken name cache.
+
+    Args:
+        key: The lowercase name.
+
+    Returns:
+        The name used in the database, or None if it's not cached (or the
+        entry expired).
+    """
+
+    entry = _TAKEN_NAMES.get(key)
+    if entry is None:
+        return None
+    elif entry[1] < time.monotonic():
+        del _TAKEN_NAMES[key]
+        return None
+    else:
+        return entry[0]
+
+
+def _cache_taken_name(key: str, name: str) -> None:
+    """
+    Record that a name is taken in the recently taken name cache. If the cache
+    is full, expired entries are removed first. If it's still full, the oldest
+    entry is removed.
+
+    Args:
+        key: The lowercase name.
+        name: The name used in the database.
+    """
+
+    now = time.monotonic()
+    if len(_TAKEN_NAMES) >= _TAKEN_NAMES_MAX_SIZE:
+        for k in [k for k, (_, exp) in _TAKEN_NAMES.items() if exp < now]:
+            del _TAKEN_NAMES[k]
+        if len(_TAKEN_NAMES) >= _TAKEN_NAMES_MAX_SIZE:
+            del _TAKEN_NAMES[next(iter(_TAKEN_NAMES))]
+
+    _TAKEN_NAMES[key] = (name, now + _TAKEN_NAMES_TTL)
+
+
 def validate_directory(directory: str) -> Path:
     """
     Validate a new directory path, and return it as a pathlib Path. If the input
@@ -177,7 +266,8 @@ def validate_directory(directory: str) -> Path:
 
     # If it's not absolute, resolve it from the default timelapse root dir
     directory = Path(directory)
-    if directory.is_absolute():
+    is_absolute: bool = directory.is_absolute()
+    if is_absolute:
         note = ''
     else:
         note = (" (Note: relative paths are resolved from the default "
@@ -185,8 +275,25 @@ def validate_directory(directory: str) -> Path:
                 f"`{settings.DEFAULT_TIMELAPSE_ROOT_DIRECTORY}`).")
         directory = settings.DEFAULT_TIMELAPSE_ROOT_DIRECTORY / directory
 
+    # Check the length of the full path once
+    is_too_long: bool = len(str(directory)) > DIRECTORY_MAX_LENGTH
+
+    # An absolute path that's too long can't be fixed by anything below, so
+    # don't bother checking the file system
+    if is_too_long and is_absolute:
+        raise utils.ValidationError(
+            msg=f"The directory path must not exceed {DIRECTORY_MAX_LENGTH} "
+                "characters."
+        )
+
+    # Stat the path once, and use that to check whether it's a file/directory
+    try:
+        mode = directory.stat().st_mode
+    except (FileNotFoundError, NotADirectoryError, ValueError):
+        mode = 0  # Doesn't exist (or is an invalid path)
+
     # Can't be a file
-    if directory.is_file():
+    if stat.S_ISREG(mode):
         ext = utils.trunc(directory.suffix, 50, escape_markdown=True)
         name = utils.trunc(
             directory.name, 100, ellipsis_str=ext, escape_markdown=True
@@ -195,8 +302,14 @@ def validate_directory(directory: str) -> Path:
             msg=f"**{name}** is a file, not a directory." + note
         )
 
-    # Can't have stuff in it
-    if directory.is_dir() and any(directory.iterdir()):
+    # Can't have stuff in it. Count the items in one pass over the directory
+    if stat.S_ISDIR(mode):
+        with os.scandir(directory) as entries:
+            n = sum(1 for _ in entries)
+    else:
+        n = 0
+
+    if n > 0:
         # Get a string pointing to the last bit of the path
         root: Path = Path(directory.root)
         if directory == root:
@@ -208,7 +321,6 @@ def validate_directory(directory: str) -> Path:
             reverse = True
 
         name = utils.trunc(name, 100, escape_markdown=True, reverse=reverse)
-        n = len(list(directory.iterdir()))
 
         raise utils.ValidationError(
             msg=f"The timelapse directory must be empty, but **{name}** "
@@ -216,7 +328,7 @@ def validate_directory(directory: str) -> Path:
         )
 
     # Can't be too long
-    if len(str(directory)) > DIRECTORY_MAX_LENGTH:
+    if is_too_long:
         raise utils.ValidationError(
             msg=f"The directory path must not exceed {DIRECTORY_MAX_LENGTH} "
                 "characters." + ('' if base_is_too_long else note)
@@ -225,7 +337,31 @@ def validate_directory(directory: str) -> Path:
     return directory
 
 
-def determine_default_directory(name: str) -> Optional[Path]:
+def _is_missing_or_empty_dir(path: Path) -> bool:
+    """
+    Check whether a path either doesn't exist or is an empty directory. This
+    uses a single stat call, plus opening the directory if there is one.
+
+    Args:
+        path: The path to check.
+
+    Returns:
+        True if and only if the path is available for a new timelapse.
+    """
+
+    try:
+        mode = path.stat().st_mode
+    except (FileNotFoundError, NotADirectoryError):
+        return True
+
+    if not stat.S_ISDIR(mode):
+        return False
+
+    with os.scandir(path) as entries:
+        return next(entries, None) is None
+
+
+async def determine_default_directory(name: str) -> Optional[Path]:
     """
     Given a timelapse name, pick a default directory in which to store its
     pictures. The directory is not created, but it may already exist. However,
@@ -234,6 +370,9 @@ def determine_default_directory(name: str) -> Optional[Path]:
     The path must fit within the DIRECTORY_MAX_LENGTH. If no directory can be
     found that meets this condition, the default directory will be None.
 
+    This probes the file system, so the work is done in a separate thread to
+    avoid blocking the event loop.
+
     Args:
         name: The name of the timelapse.
 
@@ -242,13 +381,37 @@ def determine_default_directory(name: str) -> Optional[Path]:
         to pick a directory without exceeding the maximum length, None.
     """
 
+    return await asyncio.to_thread(_determine_default_directory, name)
+
+
+def _determine_default_directory(name: str) -> Optional[Path]:
+    """
+    Pick a default directory for a timelapse. This is the blocking
+    implementation of determine_default_directory(); see there for details.
+
+    Args:
+        name: The name of the timelapse.
+
+    Returns:
+        The path to the automatically chosen directory, or None.
+    """
+
     root: Path = settings.DEFAULT_TIMELAPSE_ROOT_DIRECTORY
 
-    # If the timelapse root doesn't exist, it's guaranteed that 'root / name'
-    # doesn't have anything in it
-    if not root.exists():
-        d = root / name
-        return d if len(str(d)) <= DIRECTORY_MAX_LENGTH else None
+    # If the name alone makes the path too long, adding numbers to it won't
+    # help. Don't bother probing the file system
+    d = root / name
+    if len(str(d)) > DIRECTORY_MAX_LENGTH:
+        return None
+
+    # In the usual case, nothing exists at that path yet (or even at the
+    # timelapse root). That takes just one stat call to confirm
+    try:
+        d.stat()
+    except FileNotFoundError:
+        return d
+    except NotADirectoryError:
+        pass  # The root is a file; that's handled below
 
     # This shouldn't ever happen, but it's possible that the default timelapse
     # root dir was created as a file since the program started
@@ -258,13 +421,12 @@ def determine_default_directory(name: str) -> Optional[Path]:
                      f"Changing it to '{new}'")
         settings.DEFAULT_TIMELAPSE_ROOT_DIRECTORY = new
         root = new
+        d = root / name
+        if len(str(d)) > DIRECTORY_MAX_LENGTH:
+            return None
 
     # Try using the timelapse name as a directory name. If that doesn't work,
     # keep adding numbers to it until it does.
-    d = utils.get_unique_path(
-        root / name,
-        lambda p: not p.exists() or  # Either doesn't exist, or
-                  (p.is_dir() and not any(p.iterdir()))  # empty directory
-    )
+    d = utils.get_unique_path(d, _is_missing_or_empty_dir)
 
     return d if len(str(d)) <= DIRECTORY_MAX_LENGTH else None
@@ -59,6 +59,31 @@ DATABASE_NAME = dc.DefaultConfigEntry(
     has_default=False
 )
 
+# The number of database connections to keep open in the connection pool
+DATABASE_POOL_SIZE = dc.DefaultConfigEntry(
+    section='db',
+    default=5,
+    cast_func=partial(dc.to_int, min_value=1),
+    expected='a positive integer'
+)
+
+# The number of extra connections allowed beyond the pool size during bursts
+DATABASE_MAX_OVERFLOW = dc.DefaultConfigEntry(
+    section='db',
+    default=10,
+    cast_func=partial(dc.to_int, min_value=0),
+    expected='a positive integer or 0'
+)
+
+# Replace pooled connections after this many seconds, so they're never closed
+# by the server for being idle too long
+DATABASE_POOL_RECYCLE = dc.DefaultConfigEntry(
+    section='db',
+    default=3600,
+    cast_func=partial(dc.to_int, min_value=1),
+    expected='a time in seconds'
+)
+
 ################################################################################
 
 # The minimum log level that goes to the console
@@ -16,6 +16,10 @@ from .rotation import Rotation
 
 _log = logging.getLogger(__name__)
 
+# Keep references to the background tasks deleting preview images until they
+# finish, so they aren't garbage collected
+_pending_deletions: set[asyncio.Task] = set()
+
 
 async def handle_gphoto_error(interaction: discord.Interaction[commands.Bot],
                               error: gp.GPhoto2Error,
@@ -155,10 +159,25 @@ async def preview_image_embed(camera) -> tuple[Embed, File]:
     try:
         yield embed, file
     finally:
-        # Delete the preview image
-        try:
-            await asyncio.to_thread(path.unlink)
-            _log.debug(f'Deleted preview photo: {path}')
-        except OSError as e:
-            _log.warning(f"Attempted to delete preview photo, but it didn't "
-                         f"exist for some reason: path='{path}', {e}")
+        # Delete the preview image in the background. It's already been sent,
+        # so there's no need to make the command wait for it
+        task = asyncio.create_task(_delete_preview_image(path))
+        _pending_deletions.add(task)
+        task.add_done_callback(_pending_deletions.discard)
+
+
+async def _delete_preview_image(path: Path) -> None:
+    """
+    Delete a preview image from tmp storage. If it doesn't exist, a warning is
+    logged.
+
+    Args:
+        path: The path to the preview image.
+    """
+
+    try:
+        await asyncio.to_thread(path.unlink)
+        _log.debug(f'Deleted preview photo: {path}')
+    except OSError as e:
+        _log.warning(f"Attempted to delete preview photo, but it didn't "
+                     f"exist for some reason: path='{path}', {e}")
@@ -39,7 +39,13 @@ async def initialize() -> None:
     _log.debug("Creating database engine...")
     # pool_pre_ping=True to prevent losing connection to database at very
     # slight performance hit
-    engine = create_async_engine(db_url, pool_pre_ping=True)
+    engine = create_async_engine(
+        db_url,
+        pool_pre_ping=True,
+        pool_size=settings.DATABASE_POOL_SIZE,
+        max_overflow=settings.DATABASE_MAX_OVERFLOW,
+        pool_recycle=settings.DATABASE_POOL_RECYCLE
+    )
 
     _log.debug("Creating session maker...")
     async_session_maker = async_sessionmaker(bind=engine)
@@ -91,26 +91,58 @@ class Timelapse(Base):
     )
 
 
-async def get_active_timelapses(session: AsyncSession) -> list[Timelapse]:
+def _is_active():
+    """
+    Get the SQL condition that a timelapse is active: either (a) the state is
+    not FINISHED or (b) the end_time is in the future.
+
+    Returns:
+        The where clause condition.
+    """
+
+    return ((Timelapse.state != State.FINISHED) |
+            (Timelapse.end_time > datetime.now()))
+
+
+async def get_active_timelapses(session: AsyncSession,
+                                limit: Optional[int] = None) -> list[Timelapse]:
     """
     Get a list of all the timelapses where either (a) the state is not FINISHED
     or (b) the end_time is in the future.
 
     Args:
         session: The database session.
+        limit: The maximum number of timelapses to get, or None to get all of
+        them. Defaults to None.
 
     Returns:
         list[Timelapse]: The list of all active timelapses.
     """
 
-    stmt = select(Timelapse).where(
-        (Timelapse.state != State.FINISHED) |
-        (Timelapse.end_time > datetime.now())
-    )
+    stmt = select(Timelapse).where(_is_active())
+    if limit is not None:
+        stmt = stmt.limit(limit)
+
     result = await session.scalars(stmt)
     return [tl for tl in result]
 
 
+async def count_active_timelapses(session: AsyncSession) -> int:
+    """
+    Count the active timelapses without loading them. This uses the same
+    conditions as get_active_timelapses().
+
+    Args:
+        session: The database session.
+
+    Returns:
+        int: The number of active timelapses.
+    """
+
+    stmt = select(func.count()).select_from(Timelapse).where(_is_active())
+    return await session.scalar(stmt)
+
+
 async def is_name_active(session: AsyncSession, name: str) -> bool:
     """
     Check whether the given name corresponds to an active timelapse (i.e. one
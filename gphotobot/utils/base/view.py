@@ -18,6 +18,10 @@ _log = logging.getLogger(__name__)
 
 
 class BaseView(ui.View, ABC):
+    # If positive, calls to refresh_display() are coalesced: the message is
+    # edited once this many seconds after the last call in a burst
+    REFRESH_DELAY: float = 0
+
     def __init__(self,
                  parent: Interaction[Bot] | BaseView | Message,
                  user: User | Member | None = None,
@@ -89,6 +93,26 @@ class BaseView(ui.View, ABC):
         self.restrict_to_owner: bool = restrict_to_owner
         self.permission_error_msg: str = permission_error_msg
 
+        # Deferred component callbacks hold this lock while they run. That way
+        # rapid clicks are applied one at a time, in the order they arrived
+        self._callback_lock: asyncio.Lock = asyncio.Lock()
+
+        # The render_key() from the last time the display was refreshed
+        self._render_key: Optional[tuple] = None
+
+        # Whether this view is currently shown on the message. Until it is, its
+        # refreshes aren't delayed
+        self._is_displayed: bool = False
+
+        # The pending debounced refresh (see REFRESH_DELAY), and the loop time
+        # when it should run. The task is cleared once it starts editing
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._refresh_deadline: float = 0
+
+        # Held while editing the message, so edits from this view finish in
+        # the order they started
+        self._refresh_lock: asyncio.Lock = asyncio.Lock()
+
     @abstractmethod
     async def build_embed(self, *args, **kwargs) -> Optional[Embed]:
         """
@@ -104,6 +128,42 @@ class BaseView(ui.View, ABC):
 
         pass
 
+    def render_key(self) -> Optional[tuple]:
+        """
+        Get a hashable snapshot of the state shown by this view. If it matches
+        the key from the previous refresh, refresh_display() skips editing the
+        message, as nothing would change.
+
+        Subclasses that support this should include component_key() in the
+        returned tuple. By default, this returns None, which means the display
+        is always refreshed.
+
+        Returns:
+            The render key, or None to always refresh.
+        """
+
+        return None
+
+    def component_key(self) -> tuple:
+        """
+        Get a hashable snapshot of the components (buttons, menus, etc.) in
+        this view, for use in render_key().
+
+        Returns:
+            A tuple with the visible attributes of each component.
+        """
+
+        return tuple(
+            (type(item).__name__,
+             item.row,
+             getattr(item, 'label', None),
+             str(getattr(item, 'emoji', None)),
+             getattr(item, 'style', None),
+             getattr(item, 'disabled', None),
+             tuple((o.label, o.default) for o in getattr(item, 'options', ())))
+            for item in self.children
+        )
+
     async def get_message(self) -> Message:
         """
         Return the message containing this view. If the message is unknown and
@@ -202,16 +262,104 @@ class BaseView(ui.View, ABC):
         """
         Refresh this view's display by editing the interaction message.
 
+        If REFRESH_DELAY is set, this schedules the refresh in the background
+        and returns immediately. Any other calls before it runs are merged into
+        the same refresh. Calls with arguments are never delayed, and neither
+        is the refresh that first shows this view on the message (so that any
+        errors reach the caller).
+
         Args:
             *args: Optional arguments to pass to build_embed().
             **kwargs: Optional keyword arguments to pass to build_embed().
         """
 
-        await self.edit_original_message(
-            content='',
-            embed=await self.build_embed(*args, **kwargs),
-            view=self
-        )
+        if self.REFRESH_DELAY <= 0 or not self._is_displayed or args or kwargs:
+            # This edit supersedes any pending one
+            await self._cancel_pending_refresh()
+            await self._refresh_display_now(*args, **kwargs)
+            return
+
+        # Push back the deadline, and start a task to wait for it if needed
+        loop = asyncio.get_running_loop()
+        self._refresh_deadline = loop.time() + self.REFRESH_DELAY
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._debounced_refresh())
+
+    async def _debounced_refresh(self) -> None:
+        """
+        Wait until the refresh deadline passes, and then refresh the display
+        once. If the view was stopped in the meantime, it's not refreshed, as
+        some other view has presumably replaced it.
+        """
+
+        loop = asyncio.get_running_loop()
+        while (delay := self._refresh_deadline - loop.time()) > 0:
+            await asyncio.sleep(delay)
+
+        # Any calls from here on need a new refresh, as this one is about to
+        # build the embed
+        self._refresh_task = None
+
+        if self.is_finished():
+            return
+
+        try:
+            await self._refresh_display_now()
+        except Exception:
+            _log.exception(f'Failed to refresh {self.__class__.__name__} in '
+                           f'the background')
+
+    async def _cancel_pending_refresh(self) -> None:
+        """
+        Cancel this view's pending debounced refresh, if there is one, and wait
+        for any edit it's already making to finish. Afterwards, this view won't
+        edit the message until it's refreshed again.
+        """
+
+        task = self._refresh_task
+        if task is not None and task is not asyncio.current_task():
+            self._refresh_task = None
+            task.cancel()
+
+        # Wait out an edit in progress
+        async with self._refresh_lock:
+            pass
+
+    async def _refresh_display_now(self, *args, **kwargs) -> None:
+        """
+        Immediately refresh this view's display, unless render_key() shows that
+        nothing has changed.
+
+        Args:
+            *args: Optional arguments to pass to build_embed().
+            **kwargs: Optional keyword arguments to pass to build_embed().
+        """
+
+        async with self._refresh_lock:
+            # Skip the edit if nothing changed since the last refresh
+            key = self.render_key()
+            if key is not None and key == self._render_key:
+                _log.debug(f'Skipped refreshing unchanged '
+                           f'{self.__class__.__name__}')
+                return
+
+            # This view is replacing any parent views on the message. Stop them
+            # from overwriting it with a pending refresh, and make sure they
+            # redraw when they come back
+            parent = self.parent
+            while isinstance(parent, BaseView):
+                await parent._cancel_pending_refresh()
+                parent._render_key = None
+                parent._is_displayed = False
+                parent = parent.parent
+
+            await self.edit_original_message(
+                content='',
+                embed=await self.build_embed(*args, **kwargs),
+                view=self
+            )
+            self._render_key = key
+            self._is_displayed = True
 
     async def interaction_check(self, interaction: Interaction) -> bool:
         """
@@ -278,7 +426,8 @@ class BaseView(ui.View, ABC):
             the button's callback is not run. Defaults to None.
             add: Whether to add the button to this view. Defaults to True.
             auto_defer: Whether to immediately defer any interactions with the
-            button before running the callback function. Defaults to False.
+            button before running the callback function. Disable this for
+            callbacks that respond with a modal. Defaults to True.
 
         Returns:
             The newly created button.
@@ -294,8 +443,7 @@ class BaseView(ui.View, ABC):
         )
 
         # Overwrite the callback function with the provided one
-        button.callback = (callback if not auto_defer else
-                           utils.deferred(callback))
+        button.callback = self._wrap_callback(callback, auto_defer)
 
         # Override the interaction check if given a callback
         if interaction_check is not None:
@@ -352,7 +500,8 @@ class BaseView(ui.View, ABC):
             callback is not run. Defaults to None.
             add: Whether to add the menu to this view. Defaults to True.
             auto_defer: Whether to immediately defer any interactions with the
-            button before running the callback function. Defaults to False.
+            button before running the callback function. Disable this for
+            callbacks that respond with a modal. Defaults to True.
 
         Returns:
             The newly created menu.
@@ -391,10 +540,7 @@ class BaseView(ui.View, ABC):
             callback = partial(callback, menu=menu)
 
         # If enabled, wrap callback with util function to defer the interaction
-        if auto_defer:
-            menu.callback = utils.deferred(callback)
-        else:
-            menu.callback = callback
+        menu.callback = self._wrap_callback(callback, auto_defer)
 
         # Override the interaction check if given a callback
         if interaction_check is not None:
@@ -406,6 +552,35 @@ class BaseView(ui.View, ABC):
 
         return menu
 
+    def _wrap_callback(self,
+                       callback: Callable[[Interaction], Awaitable],
+                       auto_defer: bool) -> Callable[[Interaction], Awaitable]:
+        """
+        Prepare the callback function for a component in this view.
+
+        If auto_defer is enabled, the interaction is deferred immediately, and
+        then the callback waits for any other callbacks on this view to finish
+        before running. Otherwise, the callback is returned unchanged, as it
+        likely needs to send a modal within Discord's initial response window.
+
+        Args:
+            callback: The async callback function for the component.
+            auto_defer: Whether to defer the interaction before running the
+            callback.
+
+        Returns:
+            The callback to assign to the component.
+        """
+
+        if not auto_defer:
+            return callback
+
+        async def run(interaction: Interaction, *args, **kwargs) -> any:
+            async with self._callback_lock:
+                return await callback(interaction, *args, **kwargs)
+
+        return utils.deferred(run)
+
     def add_items(self, items: Optional[Iterable[ui.Item]]) -> None:
         """
         Bulk add multiple items (buttons, etc.) from this view.
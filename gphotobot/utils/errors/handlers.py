@@ -1,4 +1,6 @@
+import asyncio
 from datetime import datetime, timezone
+import functools
 import logging
 import re
 import traceback
@@ -185,14 +187,21 @@ async def handle_err(interaction: Interaction[Bot],
         show_traceback (bool, optional): Add traceback. Defaults to False.
     """
 
-    # Build an embed to nicely display the error
-    embed = error_embed(
+    # Build an embed to nicely display the error. Formatting the traceback
+    # can take a while for deep stacks, so do that in a separate thread to
+    # avoid blocking the event loop
+    build_embed = functools.partial(
+        error_embed,
         error=error,
         text=text,
         title=title,
         show_details=show_details,
         show_traceback=show_traceback
     )
+    if show_traceback:
+        embed = await asyncio.to_thread(build_embed)
+    else:
+        embed = build_embed()
 
     # Send the error message
     await utils.update_interaction(interaction, embed)
@@ -25,6 +25,22 @@ class DayOfWeek(Enum):
     Saturday = (5, 'S', 'Sat')
     Sunday = (6, 'U', 'Sun')
 
+    def __init__(self, index: int, letter: str, abbreviation: str):
+        """
+        Store each part of the value tuple as an attribute, so that the
+        properties don't have to look up and index the value every time.
+        These are used heavily when building strings for schedule rules.
+
+        Args:
+            index: The index (sorting order) of the day.
+            letter: The single letter abbreviation.
+            abbreviation: The short name.
+        """
+
+        self._index: int = index
+        self._letter: str = letter
+        self._abbreviation: str = abbreviation
+
     @property
     def index(self) -> int:
         """
@@ -34,7 +50,7 @@ class DayOfWeek(Enum):
             The index.
         """
 
-        return self.value[0]
+        return self._index
 
     @property
     def letter(self) -> str:
@@ -45,7 +61,7 @@ class DayOfWeek(Enum):
             The one letter abbreviation.
         """
 
-        return self.value[1]
+        return self._letter
 
     @property
     def abbreviation(self) -> str:
@@ -56,7 +72,7 @@ class DayOfWeek(Enum):
             The three letter abbreviation.
         """
 
-        return self.value[2]
+        return self._abbreviation
 
     # Alias for abbreviation()
     @property
@@ -1,14 +1,16 @@
 from datetime import datetime, time, timedelta, timezone
+import functools
 import re
 
 # noinspection SpellCheckingInspection
 # This RegEx parses time durations written like this: "4hr 3m 2.5sec"
-TIME_DELTA_REGEX = (
+TIME_DELTA_REGEX = re.compile(
     r'^(?:(\d*\.?\d+|\d+\.)\s*(?:\s|y|yrs?|years?))?\s*'
     r'(?:(\d*\.?\d+|\d+\.)\s*(?:\s|ds?|dys?|days?))?\s*'
     r'(?:(\d*\.?\d+|\d+\.)\s*(?:\s|h|hours?|hrs?)?(?:\s*|:))??'
     r'(?:(\d*\.?\d+|\d+\.)\s*(?:\s|m|minutes?|mins?)?(?:\s*|:))??'
-    r'(?:(\d*\.?\d+|\d+\.)\s*(?:s|seconds?|secs?)?)?$'
+    r'(?:(\d*\.?\d+|\d+\.)\s*(?:s|seconds?|secs?)?)?$',
+    re.IGNORECASE
 )
 
 
@@ -46,6 +48,27 @@ def format_duration(seconds: float | timedelta,
     if isinstance(seconds, timedelta):
         seconds = seconds.total_seconds()
 
+    return _format_duration(seconds, always_decimal, spaces)
+
+
+@functools.lru_cache(maxsize=256)
+def _format_duration(seconds: float,
+                     always_decimal: bool,
+                     spaces: bool) -> str:
+    """
+    Format a number of seconds as a string. This is the cached implementation
+    of format_duration(); see there for details. The same few capture intervals
+    are formatted over and over for embeds and logs.
+
+    Args:
+        seconds: The number of seconds.
+        always_decimal: Whether to always include a decimal number of seconds.
+        spaces: Whether to include spaces between each unit of time.
+
+    Returns:
+        str: The formatted time string.
+    """
+
     # We'll use the absolute value of seconds and then tack on the negative
     # sign if it was originally negative
     is_negative: bool = seconds < 0
@@ -188,17 +211,13 @@ def parse_time_delta(s: str) -> timedelta | None:
     if not s:
         return None
 
-    match = re.match(TIME_DELTA_REGEX, s.strip().lower(), re.IGNORECASE)
+    match = TIME_DELTA_REGEX.match(s.strip().lower())
 
     if not match:
         return None
 
     # Extract units
-    y = match.group(1)
-    d = match.group(2)
-    h = match.group(3)
-    m = match.group(4)
-    s = match.group(5)
+    y, d, h, m, s = match.groups()
 
     # Combine into a timedelta
     return timedelta(
@@ -301,7 +301,8 @@ def deferred(callback: Callable[[Interaction, ...], Awaitable] | \
         Callable[[Interaction], Awaitable]:
     """
     Given a callback function that accepts an interaction, wrap it such that the
-    interaction is immediately deferred.
+    interaction is immediately deferred. If the interaction already received a
+    response, it is passed along to the callback unchanged.
 
     Args:
         callback: The callback function to wrap. This must accept an
@@ -313,7 +314,9 @@ def deferred(callback: Callable[[Interaction, ...], Awaitable] | \
     """
 
     async def defer(interaction: Interaction, *args, **kwargs) -> any:
-        await interaction.response.defer()
+        if not interaction.response.is_done():
+            await interaction.response.defer()
+
         # Include *args and **kwargs just in case more arguments were given
         return await callback(interaction, *args, **kwargs)
 
@@ -372,9 +375,12 @@ def set_menu_default(menu: ui.Select, default: str | Collection[str]):
         default: One or more items to mark default, referenced by their labels.
     """
 
-    # Encapsulate a single entry in a tuple
+    # Encapsulate a single entry in a tuple, and use a set for multiple
+    # entries to make the membership check below constant time
     if isinstance(default, str):
         default = (default,)
+    elif not isinstance(default, (set, frozenset)):
+        default = frozenset(default)
 
     # Set default options
     for option in menu.options: